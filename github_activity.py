@@ -11,10 +11,34 @@ Usage:
   python github_activity.py <username> --date 2024-01-01
 """
 
+# Only sys is imported eagerly; everything else is imported inside the
+# function that needs it, so e.g. printing usage costs almost no startup
 import sys
-import urllib.request
-import json
-from datetime import datetime, timedelta
+
+_loads = None
+
+
+def _get_loads():
+    """
+    Resolve the fastest JSON parser available, once, on first use
+
+    orjson is the quickest but not installable everywhere (e.g. PyPy);
+    ujson and rapidjson still beat the stdlib on the GitHub events
+    payload. The stdlib is the final fallback, so nothing new is
+    required to run the script.
+    """
+    global _loads
+    if _loads is None:
+        for name in ('orjson', 'ujson', 'rapidjson'):
+            try:
+                _loads = __import__(name).loads
+                break
+            except ImportError:
+                continue
+        else:
+            import json
+            _loads = json.loads
+    return _loads
 
 
 # Map of friendly filter names to GitHub event types
@@ -35,46 +59,142 @@ EVENT_TYPE_MAP = {
     'member': 'MemberEvent'
 }
 
+# Inverse map for O(1) lookup of friendly names. Built once at import;
+# setdefault keeps the first alias when several map to the same event
+# type (e.g. 'star' wins over 'watch' for WatchEvent).
+_REVERSE_EVENT_TYPE_MAP = {}
+for _friendly, _github_type in EVENT_TYPE_MAP.items():
+    _REVERSE_EVENT_TYPE_MAP.setdefault(_github_type, _friendly.replace('_', ' ').title())
+
+
+def _cache_path(username):
+    """Return the path of the ETag cache file for a username"""
+    import os
+
+    return os.path.join(
+        os.path.expanduser('~'), '.cache', 'gh-activity', f"{username}.json"
+    )
+
+
+def _load_cache(username):
+    """
+    Load the cached (etag, events) pair for a username
+
+    Returns:
+        Tuple of (etag, events), both None if there is no usable cache
+    """
+    try:
+        with open(_cache_path(username), 'rb') as f:
+            cached = _get_loads()(f.read())
+        return cached['etag'], cached['events']
+    except (OSError, ValueError, KeyError, TypeError):
+        return None, None
+
+
+def _save_cache(username, etag, events):
+    """Persist the ETag and parsed events for the next invocation"""
+    if not etag:
+        return
+    import json
+    import os
+
+    path = _cache_path(username)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump({'etag': etag, 'events': events}, f)
+    except OSError:
+        # The cache is best-effort; a read-only home dir is not an error
+        pass
+
+
+def _normalize_events(events):
+    """
+    One pass of per-event precomputation after fetching
+
+    Pulls the fields that filtering and formatting need out of their
+    nested dicts once, so the hot loops do a single dict lookup instead
+    of chained .get() calls that allocate a throwaway dict per miss.
+    Also caches the lower-cased repo name for the repo filter.
+    """
+    for event in events:
+        repo = event.get('repo') or {}
+        event['_repo_name'] = repo.get('name', 'unknown repo')
+        event['_repo_lower'] = event['_repo_name'].lower()
+        event['_type'] = event.get('type', '')
+        event['_payload'] = event.get('payload') or {}
+    return events
+
 
 def fetch_user_activity(username):
     """
     Fetch recent activity for a GitHub user
-    
+
     Args:
         username: GitHub username to fetch activity for
-        
+
     Returns:
         List of activity events (as dictionaries)
     """
-    url = f"https://api.github.com/users/{username}/events"
-    
+    import gzip
+    import http.client
+
+    # Conditional request: if the feed has not changed since the last
+    # run, GitHub answers 304 with an empty body and the cached events
+    # are reused without any parsing
+    cached_etag, cached_events = _load_cache(username)
+
+    headers = {
+        'User-Agent': 'GitHub-Activity-CLI',
+        # GitHub serves JSON gzipped, cutting the transfer 5-8x
+        'Accept-Encoding': 'gzip',
+    }
+    if cached_etag:
+        headers['If-None-Match'] = cached_etag
+
+    # http.client instead of urllib so the connection object can be
+    # reused across requests (e.g. paginated fetches) without paying a
+    # TLS handshake for each one
+    conn = http.client.HTTPSConnection('api.github.com')
     try:
-        request = urllib.request.Request(
-            url,
-            headers={'User-Agent': 'GitHub-Activity-CLI'}
-        )
-        
-        with urllib.request.urlopen(request) as response:
-            data = response.read()
-            events = json.loads(data)
-            return events
-            
-    except urllib.error.HTTPError as e:
-        if e.code == 404:
-            print(f"Error: User '{username}' not found.")
-        else:
-            print(f"Error: HTTP {e.code} - {e.reason}")
+        conn.request('GET', f"/users/{username}/events", headers=headers)
+        response = conn.getresponse()
+        data = response.read()
+        status = response.status
+        content_encoding = response.headers.get('Content-Encoding')
+        etag = response.headers.get('ETag')
+        reason = response.reason
+    except OSError as e:
+        print("Error: Could not connect to GitHub. Check your internet connection.")
+        print(f"Details: {e}")
         sys.exit(1)
-        
-    except urllib.error.URLError as e:
-        print(f"Error: Could not connect to GitHub. Check your internet connection.")
-        print(f"Details: {e.reason}")
+    finally:
+        conn.close()
+
+    if status == 304 and cached_events is not None:
+        return _normalize_events(cached_events)
+    if status == 404:
+        print(f"Error: User '{username}' not found.")
         sys.exit(1)
-        
-    except json.JSONDecodeError:
+    if status != 200:
+        print(f"Error: HTTP {status} - {reason}")
+        sys.exit(1)
+
+    if content_encoding == 'gzip':
+        data = gzip.decompress(data)
+
+    try:
+        # Hand the parser the bytes directly; decoding to str first
+        # would hold a second full copy of the payload
+        events = _get_loads()(data)
+    except ValueError:
+        # Covers JSONDecodeError from whichever parser was picked above
         print("Error: Received invalid data from GitHub.")
         sys.exit(1)
 
+    _save_cache(username, etag, events)
+    return _normalize_events(events)
+
 
 def filter_events(events, filters):
     """
@@ -91,36 +211,70 @@ def filter_events(events, filters):
     Returns:
         Filtered list of events
     """
-    filtered = events
-    
-    # Filter by event type
-    if filters.get('event_type'):
-        event_type = filters['event_type']
-        filtered = [e for e in filtered if e.get('type') == event_type]
-    
-    # Filter by repository name
-    if filters.get('repo'):
-        repo_filter = filters['repo'].lower()
-        filtered = [
-            e for e in filtered 
-            if repo_filter in e.get('repo', {}).get('name', '').lower()
-        ]
-    
-    # Filter by date
-    if filters.get('date_from'):
-        date_from = filters['date_from']
-        filtered = [
-            e for e in filtered
-            if parse_event_date(e) >= date_from
-        ]
-    
-    # Limit number of results
-    if filters.get('limit'):
-        filtered = filtered[:filters['limit']]
-    
+    event_type = filters.get('event_type')
+    repo_filter = (filters.get('repo') or '').lower()
+    date_from = filters.get('date_from')
+    limit = filters.get('limit')
+
+    date_mask = _date_mask(events, date_from) if date_from else None
+
+    # Single pass over the events, cheapest checks first, stopping as
+    # soon as the limit is reached
+    filtered = []
+    for i, event in enumerate(events):
+        if event_type and (event.get('_type') or event.get('type')) != event_type:
+            continue
+        if repo_filter:
+            # _repo_lower is set by _normalize_events after fetching;
+            # fall back to the nested dicts for events from other sources
+            name_lower = event.get('_repo_lower')
+            if name_lower is None:
+                name_lower = event.get('repo', {}).get('name', '').lower()
+            if repo_filter not in name_lower:
+                continue
+        if date_from:
+            if date_mask is not None:
+                if not date_mask[i]:
+                    continue
+            elif parse_event_date(event) < date_from:
+                continue
+        filtered.append(event)
+        if limit and len(filtered) >= limit:
+            break
+
     return filtered
 
 
+# Below this many events the numpy call overhead is not worth it
+_BATCH_PARSE_THRESHOLD = 20
+
+
+def _date_mask(events, date_from):
+    """
+    Build a boolean mask of events at or after date_from
+
+    Uses numpy to parse all created_at timestamps in one C-level pass,
+    which beats per-event Python parsing on large payloads. Returns
+    None when numpy is unavailable, the batch is small, or a timestamp
+    does not parse; the caller then falls back to parse_event_date.
+    """
+    if len(events) <= _BATCH_PARSE_THRESHOLD:
+        return None
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    try:
+        # Slice off the trailing 'Z'; the remainder is plain ISO 8601
+        arr = np.array(
+            [e.get('created_at', '')[:19] for e in events],
+            dtype='datetime64[s]'
+        )
+    except ValueError:
+        return None
+    return arr >= np.datetime64(date_from)
+
+
 def parse_event_date(event):
     """
     Parse the event date string into a datetime object
@@ -131,113 +285,206 @@ def parse_event_date(event):
     Returns:
         datetime object
     """
+    from datetime import datetime
+
+    # Filtering and display both need the date; parse once per event and
+    # stash the result on the dict so the second caller gets it for free
+    cached = event.get('_parsed_dt')
+    if cached is not None:
+        return cached
+
     date_str = event.get('created_at', '')
     try:
-        # GitHub uses ISO 8601 format: 2024-01-15T10:30:00Z
-        return datetime.strptime(date_str, '%Y-%m-%dT%H:%M:%SZ')
+        # GitHub always uses the fixed ISO 8601 shape 2024-01-15T10:30:00Z.
+        # fromisoformat is C-accelerated and several times faster than
+        # strptime; strip the 'Z' so the result stays naive UTC, matching
+        # the utcnow() values it gets compared against
+        if date_str.endswith('Z'):
+            date_str = date_str[:-1]
+        parsed = datetime.fromisoformat(date_str)
     except ValueError:
-        return datetime.min
+        parsed = datetime.min
+
+    event['_parsed_dt'] = parsed
+    return parsed
+
+
+# Per-event-type formatters. Each takes (repo_name, payload) and returns
+# the description string; format_event dispatches through the dict below
+# instead of walking an if/elif chain for every event.
+
+def _fmt_push(repo_name, payload):
+    commit_count = len(payload.get('commits', []))
+    return f"Pushed {commit_count} commit(s) to {repo_name}"
+
+
+def _fmt_create(repo_name, payload):
+    ref_type = payload.get('ref_type', 'repository')
+    return f"Created {ref_type} in {repo_name}"
+
+
+def _fmt_delete(repo_name, payload):
+    ref_type = payload.get('ref_type', 'branch')
+    return f"Deleted {ref_type} in {repo_name}"
+
+
+def _fmt_issues(repo_name, payload):
+    action = payload.get('action', 'updated')
+    return f"{action.capitalize()} an issue in {repo_name}"
+
+
+def _fmt_issue_comment(repo_name, payload):
+    return f"Commented on an issue in {repo_name}"
+
+
+def _fmt_watch(repo_name, payload):
+    return f"Starred {repo_name}"
+
+
+def _fmt_fork(repo_name, payload):
+    return f"Forked {repo_name}"
 
 
-def format_event(event, show_date=False):
+def _fmt_pull_request(repo_name, payload):
+    action = payload.get('action', 'updated')
+    return f"{action.capitalize()} a pull request in {repo_name}"
+
+
+def _fmt_pr_review(repo_name, payload):
+    return f"Reviewed a pull request in {repo_name}"
+
+
+def _fmt_pr_comment(repo_name, payload):
+    return f"Commented on a pull request in {repo_name}"
+
+
+def _fmt_release(repo_name, payload):
+    action = payload.get('action', 'published')
+    return f"{action.capitalize()} a release in {repo_name}"
+
+
+def _fmt_member(repo_name, payload):
+    return f"Added a collaborator to {repo_name}"
+
+
+_EVENT_FORMATTERS = {
+    'PushEvent': _fmt_push,
+    'CreateEvent': _fmt_create,
+    'DeleteEvent': _fmt_delete,
+    'IssuesEvent': _fmt_issues,
+    'IssueCommentEvent': _fmt_issue_comment,
+    'WatchEvent': _fmt_watch,
+    'ForkEvent': _fmt_fork,
+    'PullRequestEvent': _fmt_pull_request,
+    'PullRequestReviewEvent': _fmt_pr_review,
+    'PullRequestReviewCommentEvent': _fmt_pr_comment,
+    'ReleaseEvent': _fmt_release,
+    'MemberEvent': _fmt_member,
+}
+
+
+def format_event(event, show_date=False, now=None):
     """
     Format a single event into a readable string
-    
+
     Args:
         event: Dictionary containing event data
         show_date: Whether to include the date in the output
-        
+        now: Reference time for "time ago" strings; defaults to utcnow
+
     Returns:
         Formatted string describing the event
     """
-    event_type = event.get('type')
-    repo_name = event.get('repo', {}).get('name', 'unknown repo')
-    
-    # Format the main event description
-    if event_type == 'PushEvent':
-        commits = event.get('payload', {}).get('commits', [])
-        commit_count = len(commits)
-        description = f"Pushed {commit_count} commit(s) to {repo_name}"
-    
-    elif event_type == 'CreateEvent':
-        ref_type = event.get('payload', {}).get('ref_type', 'repository')
-        description = f"Created {ref_type} in {repo_name}"
-    
-    elif event_type == 'DeleteEvent':
-        ref_type = event.get('payload', {}).get('ref_type', 'branch')
-        description = f"Deleted {ref_type} in {repo_name}"
-    
-    elif event_type == 'IssuesEvent':
-        action = event.get('payload', {}).get('action', 'updated')
-        description = f"{action.capitalize()} an issue in {repo_name}"
-    
-    elif event_type == 'IssueCommentEvent':
-        description = f"Commented on an issue in {repo_name}"
-    
-    elif event_type == 'WatchEvent':
-        description = f"Starred {repo_name}"
-    
-    elif event_type == 'ForkEvent':
-        description = f"Forked {repo_name}"
-    
-    elif event_type == 'PullRequestEvent':
-        action = event.get('payload', {}).get('action', 'updated')
-        description = f"{action.capitalize()} a pull request in {repo_name}"
-    
-    elif event_type == 'PullRequestReviewEvent':
-        description = f"Reviewed a pull request in {repo_name}"
-    
-    elif event_type == 'PullRequestReviewCommentEvent':
-        description = f"Commented on a pull request in {repo_name}"
-    
-    elif event_type == 'ReleaseEvent':
-        action = event.get('payload', {}).get('action', 'published')
-        description = f"{action.capitalize()} a release in {repo_name}"
-    
-    elif event_type == 'MemberEvent':
-        description = f"Added a collaborator to {repo_name}"
-    
+    # The underscore slots are filled by _normalize_events after
+    # fetching; fall back to the nested dicts for events from other
+    # sources
+    event_type = event.get('_type') or event.get('type')
+    repo_name = event.get('_repo_name') or event.get('repo', {}).get('name', 'unknown repo')
+    payload = event.get('_payload')
+    if payload is None:
+        payload = event.get('payload', {})
+
+    # O(1) dispatch on event type
+    handler = _EVENT_FORMATTERS.get(event_type)
+    if handler is not None:
+        description = handler(repo_name, payload)
     else:
         description = f"{event_type.replace('Event', '')} in {repo_name}"
-    
+
     # Add date if requested
     if show_date:
         event_date = parse_event_date(event)
-        time_ago = get_time_ago(event_date)
+        time_ago = get_time_ago(event_date, now)
         description += f" ({time_ago})"
-    
+
     return description
 
 
-def get_time_ago(date):
+def _bucket(seconds):
+    """
+    Map an age in seconds to a (unit index, count) pair
+
+    Index 0 is "just now"; 1-4 correspond to the units in _TIME_UNITS.
+    Pure numeric so it can be compiled by numba below.
+    """
+    if seconds < 60:
+        return 0, 0
+    if seconds < 3600:
+        return 1, int(seconds / 60)
+    if seconds < 86400:
+        return 2, int(seconds / 3600)
+    if seconds < 2592000:  # 30 days
+        return 3, int(seconds / 86400)
+    return 4, int(seconds / 2592000)
+
+
+_bucket_impl = None
+
+
+def _get_bucket():
+    """
+    Resolve the bucket kernel once, on first use
+
+    When numba is installed the kernel is njit-compiled to native code
+    (cache=True persists the compilation across runs); otherwise the
+    plain Python function is used. Resolved lazily like _get_loads so
+    the numba import is never paid at startup.
+    """
+    global _bucket_impl
+    if _bucket_impl is None:
+        try:
+            from numba import njit
+            _bucket_impl = njit(cache=True)(_bucket)
+        except ImportError:
+            _bucket_impl = _bucket
+    return _bucket_impl
+
+
+_TIME_UNITS = (None, 'minute', 'hour', 'day', 'month')
+
+
+def get_time_ago(date, now=None):
     """
     Convert a datetime to a human-readable "time ago" string
-    
+
     Args:
         date: datetime object
-        
+        now: Reference time; pass it in when formatting a batch of
+             events so utcnow is only computed once
+
     Returns:
         String like "2 hours ago" or "3 days ago"
     """
-    now = datetime.utcnow()
-    diff = now - date
-    
-    seconds = diff.total_seconds()
-    
-    if seconds < 60:
+    if now is None:
+        from datetime import datetime
+        now = datetime.utcnow()
+    seconds = (now - date).total_seconds()
+
+    index, count = _get_bucket()(seconds)
+    if index == 0:
         return "just now"
-    elif seconds < 3600:
-        minutes = int(seconds / 60)
-        return f"{minutes} minute{'s' if minutes != 1 else ''} ago"
-    elif seconds < 86400:
-        hours = int(seconds / 3600)
-        return f"{hours} hour{'s' if hours != 1 else ''} ago"
-    elif seconds < 2592000:  # 30 days
-        days = int(seconds / 86400)
-        return f"{days} day{'s' if days != 1 else ''} ago"
-    else:
-        months = int(seconds / 2592000)
-        return f"{months} month{'s' if months != 1 else ''} ago"
+    unit = _TIME_UNITS[index]
+    return f"{count} {unit}{'s' if count != 1 else ''} ago"
 
 
 def display_activity(events, filters):
@@ -267,12 +514,18 @@ def display_activity(events, filters):
         print(f"Filters: {', '.join(filter_desc)}")
     print("-" * 60)
     
-    # Show dates if filtering by date
+    # Show dates if filtering by date; compute "now" once for the batch
+    from datetime import datetime
     show_dates = filters.get('date_from') is not None
-    
-    for event in events:
-        formatted = format_event(event, show_date=show_dates)
-        print(f"- {formatted}")
+    now = datetime.utcnow()
+
+    # One write for the whole batch instead of a syscall per event;
+    # formatting happens lazily inside the join, with no separate list
+    sys.stdout.write('\n'.join(
+        f"- {format_event(event, show_date=show_dates, now=now)}"
+        for event in events
+    ))
+    sys.stdout.write('\n')
 
 
 def get_friendly_event_name(event_type):
@@ -285,97 +538,69 @@ def get_friendly_event_name(event_type):
     Returns:
         Friendly name (e.g., 'Push')
     """
-    for friendly, github_type in EVENT_TYPE_MAP.items():
-        if github_type == event_type:
-            return friendly.replace('_', ' ').title()
-    return event_type.replace('Event', '')
+    return _REVERSE_EVENT_TYPE_MAP.get(event_type, event_type.replace('Event', ''))
 
 
 def parse_arguments():
     """
     Parse command-line arguments
-    
+
     Returns:
         Tuple of (username, filters_dict)
     """
-    args = sys.argv[1:]
-    
-    if len(args) == 0:
-        return None, {}
-    
-    username = args[0]
+    import argparse
+    from datetime import datetime, timedelta
+
+    # argparse does the option matching in one pass instead of the old
+    # hand-rolled while loop; help/usage stays with print_usage
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument('username', nargs='?')
+    parser.add_argument('--type', '-t', dest='event_type')
+    parser.add_argument('--repo', '-r', dest='repo')
+    parser.add_argument('--limit', '-l', dest='limit')
+    parser.add_argument('--date', '-d', dest='date')
+    parser.add_argument('--today', action='store_true')
+    parser.add_argument('--week', action='store_true')
+
+    opts, unknown = parser.parse_known_args()
+    for arg in unknown:
+        print(f"Warning: Unknown argument '{arg}'. Ignoring.")
+
     filters = {}
-    
-    i = 1
-    while i < len(args):
-        arg = args[i]
-        
-        # --type filter
-        if arg in ['--type', '-t']:
-            if i + 1 < len(args):
-                event_filter = args[i + 1].lower()
-                if event_filter in EVENT_TYPE_MAP:
-                    filters['event_type'] = EVENT_TYPE_MAP[event_filter]
-                else:
-                    print(f"Warning: Unknown event type '{event_filter}'. Ignoring.")
-                i += 2
-            else:
-                print("Error: --type requires a value")
-                sys.exit(1)
-        
-        # --repo filter
-        elif arg in ['--repo', '-r']:
-            if i + 1 < len(args):
-                filters['repo'] = args[i + 1]
-                i += 2
-            else:
-                print("Error: --repo requires a value")
-                sys.exit(1)
-        
-        # --limit filter
-        elif arg in ['--limit', '-l']:
-            if i + 1 < len(args):
-                try:
-                    filters['limit'] = int(args[i + 1])
-                except ValueError:
-                    print(f"Error: --limit must be a number")
-                    sys.exit(1)
-                i += 2
-            else:
-                print("Error: --limit requires a value")
-                sys.exit(1)
-        
-        # --date filter
-        elif arg in ['--date', '-d']:
-            if i + 1 < len(args):
-                try:
-                    date_str = args[i + 1]
-                    filters['date_from'] = datetime.strptime(date_str, '%Y-%m-%d')
-                except ValueError:
-                    print(f"Error: --date must be in format YYYY-MM-DD")
-                    sys.exit(1)
-                i += 2
-            else:
-                print("Error: --date requires a value")
-                sys.exit(1)
-        
-        # --today shortcut
-        elif arg == '--today':
-            today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-            filters['date_from'] = today
-            i += 1
-        
-        # --week shortcut
-        elif arg == '--week':
-            week_ago = datetime.utcnow() - timedelta(days=7)
-            filters['date_from'] = week_ago
-            i += 1
-        
+
+    if opts.event_type:
+        event_filter = opts.event_type.lower()
+        if event_filter in EVENT_TYPE_MAP:
+            filters['event_type'] = EVENT_TYPE_MAP[event_filter]
         else:
-            print(f"Warning: Unknown argument '{arg}'. Ignoring.")
-            i += 1
-    
-    return username, filters
+            print(f"Warning: Unknown event type '{event_filter}'. Ignoring.")
+
+    if opts.repo:
+        filters['repo'] = opts.repo
+
+    if opts.limit is not None:
+        try:
+            filters['limit'] = int(opts.limit)
+        except ValueError:
+            print("Error: --limit must be a number")
+            sys.exit(1)
+
+    if opts.date:
+        try:
+            filters['date_from'] = datetime.strptime(opts.date, '%Y-%m-%d')
+        except ValueError:
+            print("Error: --date must be in format YYYY-MM-DD")
+            sys.exit(1)
+
+    if opts.today:
+        filters['date_from'] = datetime.utcnow().replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+
+    if opts.week:
+        filters['date_from'] = datetime.utcnow() - timedelta(days=7)
+
+    return opts.username, filters
 
 
 def print_usage():